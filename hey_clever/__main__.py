@@ -5,19 +5,8 @@ from __future__ import annotations
 import logging
 import os
 
-from hey_clever.adapters.beep_sound_cues import BeepSoundCues
-from hey_clever.adapters.clawdbot_gateway import ClawdbotGateway
-from hey_clever.adapters.edge_tts_adapter import EdgeTTSAdapter
-from hey_clever.adapters.keyword_adapter import KeywordAdapter
-from hey_clever.adapters.sounddevice_input import SoundDeviceInput
-from hey_clever.adapters.whisper_transcription import (
-    WhisperCLITranscription,
-    WhisperTinyTranscription,
-)
 from hey_clever.config.logging_config import setup_logging
 from hey_clever.config.settings import Settings
-from hey_clever.domain.vad import SileroVAD, find_silero_vad_model
-from hey_clever.domain.voice_detector import VoiceDetector
 
 log = logging.getLogger(__name__)
 
@@ -26,7 +15,24 @@ def main(settings: Settings | None = None) -> None:
     if settings is None:
         settings = Settings.from_args()
 
+    # Imported after arg handling so --help/--list-devices don't drag in the
+    # Whisper/ONNX/sounddevice stacks.
+    from hey_clever.adapters.beep_sound_cues import BeepSoundCues
+    from hey_clever.adapters.clawdbot_gateway import ClawdbotGateway
+    from hey_clever.adapters.edge_tts_adapter import EdgeTTSAdapter
+    from hey_clever.adapters.keyword_adapter import KeywordAdapter
+    from hey_clever.adapters.sounddevice_input import SoundDeviceInput
+    from hey_clever.adapters.whisper_transcription import (
+        WhisperSmallTranscription,
+        WhisperTinyTranscription,
+    )
+    from hey_clever.domain.vad import SileroVAD, find_silero_vad_model
+    from hey_clever.domain.voice_detector import VoiceDetector
+
     os.environ.setdefault("XDG_RUNTIME_DIR", "/run/user/1000")
+    # Keep OpenMP consistent with the ctranslate2 thread split so the Whisper
+    # models and the ORT VAD thread don't oversubscribe each other.
+    os.environ.setdefault("OMP_NUM_THREADS", str(max(2, (os.cpu_count() or 4) // 2)))
     setup_logging(settings.debug)
 
     log.info("Activation keywords: %s", list(settings.keyword.keywords))
@@ -37,7 +43,7 @@ def main(settings: Settings | None = None) -> None:
 
     audio_input = SoundDeviceInput(settings.audio)
     keyword_transcription = WhisperTinyTranscription()
-    command_transcription = WhisperCLITranscription(settings.transcription)
+    command_transcription = WhisperSmallTranscription(settings.transcription)
     keyword_detector = KeywordAdapter(settings.keyword)
     gateway = ClawdbotGateway(settings.gateway)
     tts = EdgeTTSAdapter(settings.tts)
@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import logging
+import time
+from functools import cache
 from typing import TYPE_CHECKING
 
 import numpy as np
@@ -17,34 +19,70 @@ log = logging.getLogger(__name__)
 SAMPLE_RATE = 16000
 
 
+@cache
 def _tone(freq: float, duration: float, volume: float = 0.3) -> np.ndarray:
+    # Cues use a handful of fixed tones — synthesize each once and cache it, so
+    # playback in the gap between keyword detection and recording allocates
+    # nothing.
     t = np.linspace(0, duration, int(SAMPLE_RATE * duration), endpoint=False)
     return (volume * 32767 * np.sin(2 * np.pi * freq * t)).astype(np.int16)
 
 
+# All four cues are fixed waveforms — build them once at import and freeze
+# them so playback never mutates the shared arrays.
+_KW_DETECTED = _tone(880, 0.15)
+_RECORDING_DONE = _tone(440, 0.2)
+_PROCESSING = np.concatenate(
+    [_tone(660, 0.08), np.zeros(int(SAMPLE_RATE * 0.06), dtype=np.int16), _tone(660, 0.08)]
+)
+# ascending three-note tone
+_RESPONSE_READY = np.concatenate([_tone(f, 0.1) for f in (440, 660, 880)])
+for _cue in (_KW_DETECTED, _RECORDING_DONE, _PROCESSING, _RESPONSE_READY):
+    _cue.setflags(write=False)
+
+
+_STREAM = None  # lazily-opened sd.OutputStream, kept for the process lifetime
+
+
 def _play(audio: np.ndarray) -> None:
+    # sd.play opens and tears down a PortAudio stream per call (~tens of ms);
+    # a resident output stream makes each cue a blocking write. On failure the
+    # stream is dropped so the next cue retries from scratch.
+    global _STREAM
     try:
-        import sounddevice as sd
-
-        sd.play(audio, samplerate=SAMPLE_RATE, blocksize=4096)
-        sd.wait()
+        if _STREAM is None:
+            import atexit
+
+            import sounddevice as sd
+
+            _STREAM = sd.OutputStream(
+                samplerate=SAMPLE_RATE, channels=1, dtype="int16", blocksize=4096
+            )
+            _STREAM.start()
+            atexit.register(_STREAM.close)
+
+        started = time.monotonic()
+        _STREAM.write(audio)
+        # write() returns once the samples are queued, not once they have
+        # sounded — block out the rest of the cue (plus output latency) so
+        # callers can unmute the mic without recording the beep's tail.
+        remaining = len(audio) / SAMPLE_RATE + _STREAM.latency - (time.monotonic() - started)
+        if remaining > 0:
+            time.sleep(remaining)
     except Exception as e:
+        _STREAM = None
         log.warning("Could not play sound cue: %s", e)
 
 
 class BeepSoundCues(ISoundCues):
     def on_keyword_detected(self) -> None:
-        _play(_tone(880, 0.15))
+        _play(_KW_DETECTED)
 
     def on_recording_done(self) -> None:
-        _play(_tone(440, 0.2))
+        _play(_RECORDING_DONE)
 
     def on_processing(self) -> None:
-        blip = _tone(660, 0.08)
-        gap = np.zeros(int(SAMPLE_RATE * 0.06), dtype=np.int16)
-        _play(np.concatenate([blip, gap, blip]))
+        _play(_PROCESSING)
 
     def on_response_ready(self) -> None:
-        # ascending three-note tone
-        notes = [_tone(f, 0.1) for f in (440, 660, 880)]
-        _play(np.concatenate(notes))
+        _play(_RESPONSE_READY)
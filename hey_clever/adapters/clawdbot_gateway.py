@@ -5,6 +5,12 @@ from __future__ import annotations
 import logging
 
 import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
 
 from hey_clever.config.settings import GatewayConfig
 from hey_clever.ports.gateway import IGateway
@@ -15,14 +21,22 @@ log = logging.getLogger(__name__)
 class ClawdbotGateway(IGateway):
     def __init__(self, config: GatewayConfig) -> None:
         self._config = config
+        # Persistent session: the TCP connection to the gateway is reused
+        # across turns and the constant headers aren't rebuilt per request.
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=1)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+        self._session.headers.update(
+            {
+                "Content-Type": "application/json",
+                "Authorization": f"Bearer {config.token}",
+                "x-clawdbot-agent-id": "main",
+            }
+        )
 
     def send(self, message: str, context: list[dict[str, str]] | None = None) -> str:
         url = f"{self._config.url}/v1/chat/completions"
-        headers = {
-            "Content-Type": "application/json",
-            "Authorization": f"Bearer {self._config.token}",
-            "x-clawdbot-agent-id": "main",
-        }
         messages: list[dict[str, str]] = []
         if context:
             messages.extend(context)
@@ -41,9 +55,18 @@ class ClawdbotGateway(IGateway):
             "messages": messages,
         }
         try:
-            resp = requests.post(url, json=payload, headers=headers, timeout=self._config.timeout)
-            resp.raise_for_status()
-            data = resp.json()
+            # orjson encodes/decodes a few times faster than stdlib json; LLM
+            # responses can be tens of KB, so the decode saving is per-turn.
+            if orjson is not None:
+                resp = self._session.post(
+                    url, data=orjson.dumps(payload), timeout=self._config.timeout
+                )
+                resp.raise_for_status()
+                data = orjson.loads(resp.content)
+            else:
+                resp = self._session.post(url, json=payload, timeout=self._config.timeout)
+                resp.raise_for_status()
+                data = resp.json()
             return data["choices"][0]["message"]["content"]
         except Exception as e:
             log.error("Gateway request failed: %s", e)
@@ -2,11 +2,16 @@
 
 from __future__ import annotations
 
+import asyncio
+import atexit
+import json
 import logging
 import os
+import socket
 import subprocess
 import sys
 import tempfile
+import threading
 import time
 
 from hey_clever.config.settings import TTSConfig
@@ -14,13 +19,261 @@ from hey_clever.ports.tts import ITTS
 
 log = logging.getLogger(__name__)
 
+# How long a successful wpctl sink preparation stays trusted before reprobing.
+_SINK_REPROBE_SEC = 300.0
+
+
+def _playback_env() -> dict[str, str]:
+    """Environment for audio subprocesses, built once instead of per playback."""
+    global _PLAYBACK_ENV
+    if _PLAYBACK_ENV is None:
+        env = os.environ.copy()
+        env.setdefault("XDG_RUNTIME_DIR", "/run/user/1000")
+        _PLAYBACK_ENV = env
+    return _PLAYBACK_ENV
+
+
+_PLAYBACK_ENV: dict[str, str] | None = None
+
+
+class _MpvController:
+    """Persistent idle-mode mpv fed files over its JSON IPC socket.
+
+    Spawning mpv per response costs fork+exec plus a fresh PipeWire connect
+    before any audio plays; a resident player makes playback start as soon as
+    the file is loaded.
+    """
+
+    def __init__(self, mpv_bin: str) -> None:
+        self._mpv_bin = mpv_bin
+        self._proc: subprocess.Popen | None = None
+        self._sock: socket.socket | None = None
+        self._socket_path = os.path.join(
+            tempfile.gettempdir(), f"hey-clever-mpv-{os.getpid()}.sock"
+        )
+
+    def _ensure_running(self) -> bool:
+        if self._proc is not None and self._proc.poll() is None and self._sock is not None:
+            return True
+        self.close()
+
+        try:
+            self._proc = subprocess.Popen(
+                [
+                    self._mpv_bin,
+                    "--idle",
+                    "--no-video",
+                    "--ao=pipewire",
+                    f"--input-ipc-server={self._socket_path}",
+                ],
+                env=_playback_env(),
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+            )
+        except OSError as e:
+            log.debug("Could not launch persistent mpv: %s", e)
+            return False
+
+        for _ in range(50):
+            if os.path.exists(self._socket_path):
+                try:
+                    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+                    sock.connect(self._socket_path)
+                    sock.settimeout(0.5)
+                    self._sock = sock
+                    return True
+                except OSError:
+                    pass
+            time.sleep(0.1)
+
+        log.debug("mpv IPC socket never appeared at %s", self._socket_path)
+        self.close()
+        return False
+
+    def play(self, path: str) -> bool:
+        """Load a file and block until playback ends. Returns False on failure."""
+        if not self._ensure_running():
+            return False
+        try:
+            self._send({"command": ["loadfile", path]})
+            return self._wait_for_end()
+        except OSError as e:
+            log.debug("mpv IPC playback failed: %s", e)
+            self.close()
+            return False
+
+    def interrupt(self) -> None:
+        if self._sock is not None:
+            try:
+                self._send({"command": ["stop"]})
+            except OSError:
+                pass
+
+    def _send(self, command: dict) -> None:
+        assert self._sock is not None
+        self._sock.sendall(json.dumps(command).encode() + b"\n")
+
+    def _wait_for_end(self) -> bool:
+        assert self._sock is not None
+        buf = b""
+        deadline = time.monotonic() + 300
+        while time.monotonic() < deadline:
+            if self._proc is None or self._proc.poll() is not None:
+                return False
+            try:
+                data = self._sock.recv(4096)
+            except TimeoutError:
+                continue
+            if not data:
+                return False
+            buf += data
+            while b"\n" in buf:
+                line, buf = buf.split(b"\n", 1)
+                try:
+                    event = json.loads(line)
+                except ValueError:
+                    continue
+                if event.get("event") == "end-file":
+                    return True
+        return False
+
+    def close(self) -> None:
+        if self._sock is not None:
+            try:
+                self._sock.close()
+            except OSError:
+                pass
+            self._sock = None
+        if self._proc is not None:
+            self._proc.terminate()
+            try:
+                self._proc.wait(timeout=2)
+            except subprocess.TimeoutExpired:
+                self._proc.kill()
+            self._proc = None
+        if os.path.exists(self._socket_path):
+            try:
+                os.unlink(self._socket_path)
+            except OSError:
+                pass
+
 
 class EdgeTTSAdapter(ITTS):
     def __init__(self, config: TTSConfig) -> None:
         self._config = config
         self._speaking = False
+        self._mpv = _MpvController(config.mpv_bin)
+        # The resident mpv must not outlive the assistant.
+        atexit.register(self._mpv.close)
+        self._sink_prepared_at: float | None = None
+        self._sink_procs: list[subprocess.Popen] = []
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        """Event loop on a dedicated thread, kept alive for the process lifetime.
+
+        asyncio.run would build and tear down a loop per utterance; a warm loop
+        keeps synthesis start-up off the response path.
+        """
+        if self._loop is None or self._loop.is_closed():
+            self._loop = asyncio.new_event_loop()
+            threading.Thread(target=self._loop.run_forever, name="tts-loop", daemon=True).start()
+        return self._loop
+
+    def _prepare_sink(self, env: dict[str, str]) -> None:
+        """Kick off sink unmute/volume non-blocking, at most once per reprobe window.
+
+        Launched with Popen so the wpctl calls run concurrently with TTS
+        synthesis; _await_sink reaps them just before playback starts.
+        """
+        now = time.monotonic()
+        if self._sink_prepared_at is not None and now - self._sink_prepared_at < _SINK_REPROBE_SEC:
+            return
+        for cmd in (
+            ["wpctl", "set-mute", "@DEFAULT_AUDIO_SINK@", "0"],
+            ["wpctl", "set-volume", "@DEFAULT_AUDIO_SINK@", "1.0"],
+        ):
+            try:
+                self._sink_procs.append(
+                    subprocess.Popen(
+                        cmd,
+                        env=env,
+                        stdin=subprocess.DEVNULL,
+                        stdout=subprocess.DEVNULL,
+                        stderr=subprocess.DEVNULL,
+                    )
+                )
+            except OSError as e:
+                log.debug("wpctl failed: %s", e)
+        self._sink_prepared_at = now
+
+    def _await_sink(self) -> None:
+        while self._sink_procs:
+            proc = self._sink_procs.pop()
+            try:
+                proc.wait(timeout=1)
+            except subprocess.TimeoutExpired:
+                proc.kill()
 
     def speak(self, text: str) -> bool:
+        # Start sink preparation now so wpctl runs concurrently with synthesis.
+        self._prepare_sink(_playback_env())
+        if self._speak_streaming(text):
+            return False
+        if self._speak_subprocess(text):
+            return False
+        self._fallback_espeak(text)
+        return False
+
+    def _speak_streaming(self, text: str) -> bool:
+        """Stream edge-tts audio straight into mpv's stdin as it is generated.
+
+        Playback starts on the first synthesized chunk instead of after the
+        whole utterance has been written to disk, and no Python subprocess is
+        spawned for the synthesis itself.
+        """
+        try:
+            import edge_tts
+        except ImportError:
+            return False
+
+        try:
+            proc = subprocess.Popen(
+                [self._config.mpv_bin, "--no-video", "--ao=pipewire", "-"],
+                env=_playback_env(),
+                stdin=subprocess.PIPE,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+            )
+        except OSError as e:
+            log.debug("Could not launch mpv for streaming TTS: %s", e)
+            return False
+
+        async def _stream() -> None:
+            communicate = edge_tts.Communicate(text, self._config.voice)
+            async for chunk in communicate.stream():
+                if chunk["type"] == "audio":
+                    assert proc.stdin is not None
+                    proc.stdin.write(chunk["data"])
+
+        self._speaking = True
+        try:
+            self._await_sink()
+            asyncio.run_coroutine_threadsafe(_stream(), self._ensure_loop()).result(timeout=120)
+            assert proc.stdin is not None
+            proc.stdin.close()
+            proc.wait(timeout=120)
+            time.sleep(0.3)
+            return True
+        except Exception as e:
+            log.warning("edge-tts streaming failed: %s", e)
+            proc.kill()
+            return False
+        finally:
+            self._speaking = False
+
+    def _speak_subprocess(self, text: str) -> bool:
         mp3_path: str | None = None
         try:
             with tempfile.NamedTemporaryFile(suffix=".mp3", delete=False) as f:
@@ -53,40 +306,35 @@ class EdgeTTSAdapter(ITTS):
                     self._play_audio(mp3_path)
                 finally:
                     self._speaking = False
-                return False
+                return True
         except Exception as e:
             log.warning("edge-tts failed: %s", e)
         finally:
             if mp3_path and os.path.exists(mp3_path):
                 os.unlink(mp3_path)
 
-        self._fallback_espeak(text)
         return False
 
     def stop(self) -> None:
+        self._mpv.interrupt()
         self._speaking = False
 
     def is_speaking(self) -> bool:
         return self._speaking
 
     def _play_audio(self, path: str) -> None:
-        env = os.environ.copy()
-        env.setdefault("XDG_RUNTIME_DIR", "/run/user/1000")
-        subprocess.run(
-            ["wpctl", "set-mute", "@DEFAULT_AUDIO_SINK@", "0"],
-            env=env,
-            capture_output=True,
-            timeout=5,
-        )
-        subprocess.run(
-            ["wpctl", "set-volume", "@DEFAULT_AUDIO_SINK@", "1.0"],
-            env=env,
-            capture_output=True,
-            timeout=5,
-        )
+        self._await_sink()
+
+        if self._mpv.play(path):
+            time.sleep(0.3)
+            return
+
+        # One-shot mpv fallback when the persistent player is unavailable.
         subprocess.run(
             [self._config.mpv_bin, "--no-video", "--ao=pipewire", path],
-            env=env,
+            env=_playback_env(),
+            check=False,
+            stdin=subprocess.DEVNULL,
             stdout=subprocess.DEVNULL,
             stderr=subprocess.DEVNULL,
         )
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+import re
 
 from hey_clever.config.settings import KeywordConfig
 from hey_clever.ports.keyword_detection import IKeywordDetector
@@ -13,16 +14,26 @@ log = logging.getLogger(__name__)
 class KeywordAdapter(IKeywordDetector):
     def __init__(self, config: KeywordConfig) -> None:
         self._keywords = config.keywords
+        # One compiled alternation scans the text in a single pass instead of
+        # walking it once per keyword; word boundaries avoid matches inside
+        # unrelated words.
+        self._pattern: re.Pattern[str] | None = None
+        if config.keywords:
+            self._pattern = re.compile(
+                r"\b(?:" + "|".join(re.escape(kw) for kw in config.keywords) + r")\b",
+                re.IGNORECASE,
+            )
 
     def detect(self, text: str) -> tuple[bool, float]:
-        text_lower = text.lower().strip()
-        if not text_lower:
+        # VAD flushes regularly hand over empty/whitespace transcripts — bail
+        # before touching the regex engine.
+        if self._pattern is None or not text or text.isspace():
             return False, 0.0
-        for kw in self._keywords:
-            if kw.lower() in text_lower:
-                log.debug("Keyword match: '%s' in '%s'", kw, text_lower)
-                return True, 1.0
-        return False, 0.0
+        match = self._pattern.search(text)
+        if match is None:
+            return False, 0.0
+        log.debug("Keyword match: '%s' in '%s'", match.group(0), text)
+        return True, 1.0
 
     def get_keywords(self) -> tuple[str, ...]:
         return self._keywords
@@ -3,34 +3,47 @@
 from __future__ import annotations
 
 import logging
-import queue
+import threading
+from collections import deque
+from typing import TYPE_CHECKING, Any
 
 import numpy as np
-import sounddevice as sd
 
 from hey_clever.config.settings import AudioConfig
 from hey_clever.ports.audio_input import IAudioInput
 
+if TYPE_CHECKING:
+    import sounddevice as sd
+
 log = logging.getLogger(__name__)
 
+# Bounded backlog: with the consumer stalled (TTS playback), old blocks drop
+# from the head instead of growing the queue without limit.
+_MAX_PENDING_BLOCKS = 64
+
 
 class SoundDeviceInput(IAudioInput):
     def __init__(self, config: AudioConfig) -> None:
         self._config = config
-        self._queue: queue.Queue[np.ndarray] = queue.Queue()
-        self._stream: sd.InputStream | None = None
+        self._buffer: deque[np.ndarray] = deque(maxlen=_MAX_PENDING_BLOCKS)
+        self._cond = threading.Condition()
+        self._stream: sd.RawInputStream | None = None
         self._muted = False
 
     def start_stream(self) -> None:
+        import sounddevice as sd
+
         device_kwargs: dict = {}
         if self._config.device is not None:
             device_kwargs["device"] = self._config.device
 
-        self._stream = sd.InputStream(
+        # RawInputStream hands the callback PortAudio's buffer directly,
+        # skipping sounddevice's per-block numpy wrapping layer.
+        self._stream = sd.RawInputStream(
             samplerate=self._config.sample_rate,
             channels=self._config.channels,
             blocksize=self._config.block_size,
-            dtype="float32",
+            dtype="int16",
             callback=self._callback,
             **device_kwargs,
         )
@@ -48,9 +61,11 @@ class SoundDeviceInput(IAudioInput):
             self._stream = None
 
     def read_chunk(self) -> np.ndarray | None:
-        try:
-            return self._queue.get(timeout=1.0)
-        except queue.Empty:
+        with self._cond:
+            if not self._buffer:
+                self._cond.wait(timeout=1.0)
+            if self._buffer:
+                return self._buffer.popleft()
             return None
 
     def get_sample_rate(self) -> int:
@@ -62,16 +77,13 @@ class SoundDeviceInput(IAudioInput):
     def set_muted(self, muted: bool) -> None:
         self._muted = muted
         if muted:
-            # drain stale audio
-            while not self._queue.empty():
-                try:
-                    self._queue.get_nowait()
-                except queue.Empty:
-                    break
+            # drain stale audio in one C-level clear
+            with self._cond:
+                self._buffer.clear()
 
     def _callback(
         self,
-        indata: np.ndarray,
+        indata: Any,  # CFFI buffer from RawInputStream
         frames: int,
         time_info: object,
         status: sd.CallbackFlags,
@@ -80,5 +92,9 @@ class SoundDeviceInput(IAudioInput):
             log.debug("Audio status: %s", status)
         if self._muted:
             return
-        block = (indata[:, 0] * 32767).astype(np.int16)
-        self._queue.put(block)
+        # One memcpy out of PortAudio's (mono int16) buffer; frombuffer over
+        # the copied bytes is a zero-copy read-only view.
+        block = np.frombuffer(bytes(indata), dtype=np.int16)
+        with self._cond:
+            self._buffer.append(block)
+            self._cond.notify()
@@ -4,8 +4,20 @@ from __future__ import annotations
 
 import logging
 
+# Logger refs fetched once — setup_logging may run repeatedly (tests, hot
+# reconfiguration) and shouldn't re-walk the logger registry each time.
+_NOISY_LOGGERS = tuple(
+    logging.getLogger(name) for name in ("httpcore", "httpx", "faster_whisper", "urllib3")
+)
+
+_configured_debug: bool | None = None
+
 
 def setup_logging(debug: bool = False) -> None:
+    global _configured_debug
+    if _configured_debug == debug:
+        return
+
     level = logging.DEBUG if debug else logging.INFO
     logging.basicConfig(
         level=level,
@@ -13,5 +25,6 @@ def setup_logging(debug: bool = False) -> None:
         datefmt="%Y-%m-%d %H:%M:%S",
         force=True,
     )
-    for name in ("httpcore", "httpx", "faster_whisper", "urllib3"):
-        logging.getLogger(name).setLevel(logging.WARNING if not debug else logging.DEBUG)
+    for noisy in _NOISY_LOGGERS:
+        noisy.setLevel(logging.WARNING if not debug else logging.DEBUG)
+    _configured_debug = debug
@@ -4,26 +4,32 @@ from __future__ import annotations
 
 import argparse
 import os
+import sys
 from dataclasses import dataclass, field
+from functools import cache
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AudioConfig:
     sample_rate: int = 16000
     channels: int = 1
-    block_size: int = 512
+    # 64ms frames: Silero accepts 512 or 1024 samples at 16kHz, and the larger
+    # frame halves the number of VAD inferences per second for +32ms worst-case
+    # detection delay — well inside the silence tails.
+    block_size: int = 1024
     device: int | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class VADConfig:
     threshold: float = 0.4
     silence_duration: float = 0.8
     min_speech_duration: float = 0.3
     max_buffer_sec: float = 5.0
+    partial_check_interval: float = 1.0
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RecordingConfig:
     silence_threshold: float = 300.0
     silence_duration: float = 2.0
@@ -31,7 +37,7 @@ class RecordingConfig:
     min_duration: float = 0.5
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class KeywordConfig:
     keywords: tuple[str, ...] = (
         "clever",
@@ -47,7 +53,7 @@ class KeywordConfig:
     )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TranscriptionConfig:
     keyword_model: str = "tiny"
     command_model: str = "small"
@@ -55,20 +61,20 @@ class TranscriptionConfig:
     language: str = "en"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GatewayConfig:
     url: str = "http://localhost:18789"
     token: str = ""
     timeout: int = 60
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TTSConfig:
     voice: str = "en-US-GuyNeural"
     mpv_bin: str = "/run/current-system/sw/bin/mpv"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Settings:
     audio: AudioConfig = field(default_factory=AudioConfig)
     vad: VADConfig = field(default_factory=VADConfig)
@@ -81,73 +87,94 @@ class Settings:
 
     @classmethod
     def from_args(cls, argv: list[str] | None = None) -> Settings:
-        parser = argparse.ArgumentParser(description="Hey Clever voice assistant")
-        parser.add_argument(
-            "--list-devices",
-            action="store_true",
-            help="List audio devices and exit",
-        )
-        parser.add_argument(
-            "--device",
-            type=int,
-            default=None,
-            help="Input device index",
-        )
-        parser.add_argument(
-            "--silence-threshold",
-            type=float,
-            default=RecordingConfig.silence_threshold,
-            help="RMS silence threshold for command recording (default: %(default)s)",
-        )
-        parser.add_argument(
-            "--keywords",
-            type=str,
-            default=None,
-            help="Comma-separated activation keywords (default: clever variants)",
-        )
-        parser.add_argument(
-            "--vad-threshold",
-            type=float,
-            default=VADConfig.threshold,
-            help="Silero VAD speech probability threshold (default: %(default)s)",
-        )
-        parser.add_argument("--debug", action="store_true")
-        # Legacy args (suppressed, kept for backward compat)
-        parser.add_argument("--wake-word", default=None, help=argparse.SUPPRESS)
-        parser.add_argument("--threshold", type=float, default=None, help=argparse.SUPPRESS)
-
-        args = parser.parse_args(argv)
-
-        if args.list_devices:
-            import sounddevice as sd
-
-            print(sd.query_devices())
-            raise SystemExit(0)
-
-        keywords: tuple[str, ...]
-        if args.keywords:
-            keywords = tuple(k.strip() for k in args.keywords.split(",") if k.strip())
-        else:
-            keywords = KeywordConfig.keywords
-
-        return cls(
-            audio=AudioConfig(device=args.device),
-            vad=VADConfig(threshold=args.vad_threshold),
-            recording=RecordingConfig(silence_threshold=args.silence_threshold),
-            keyword=KeywordConfig(keywords=keywords),
-            transcription=TranscriptionConfig(
-                whisper_bin=os.environ.get("WHISPER_BIN", TranscriptionConfig.whisper_bin),
-            ),
-            gateway=GatewayConfig(
-                url=os.environ.get("CLAWDBOT_GATEWAY_URL", GatewayConfig.url),
-                token=os.environ.get("CLAWDBOT_GATEWAY_TOKEN", GatewayConfig.token),
-            ),
-            tts=TTSConfig(
-                mpv_bin=os.environ.get("MPV_BIN", TTSConfig.mpv_bin),
-            ),
-            debug=args.debug,
+        # Memoized per (argv, relevant env vars): repeated construction during
+        # one process shares a single parse, while env changes still take
+        # effect.
+        # Defaults come from the singleton's sub-configs: with slots=True the
+        # class attributes are member descriptors, not values.
+        defaults = _DEFAULT_SETTINGS
+        return _build_settings(
+            tuple(argv) if argv is not None else tuple(sys.argv[1:]),
+            os.environ.get("WHISPER_BIN", defaults.transcription.whisper_bin),
+            os.environ.get("CLAWDBOT_GATEWAY_URL", defaults.gateway.url),
+            os.environ.get("CLAWDBOT_GATEWAY_TOKEN", defaults.gateway.token),
+            os.environ.get("MPV_BIN", defaults.tts.mpv_bin),
         )
 
     @classmethod
     def default(cls) -> Settings:
-        return cls()
+        # Frozen and hence safely shared — building Settings allocates eight
+        # dataclasses, and tests construct defaults constantly.
+        return _DEFAULT_SETTINGS
+
+
+@cache
+def _build_settings(
+    argv: tuple[str, ...],
+    whisper_bin: str,
+    gateway_url: str,
+    gateway_token: str,
+    mpv_bin: str,
+) -> Settings:
+    parser = argparse.ArgumentParser(description="Hey Clever voice assistant")
+    parser.add_argument(
+        "--list-devices",
+        action="store_true",
+        help="List audio devices and exit",
+    )
+    parser.add_argument(
+        "--device",
+        type=int,
+        default=None,
+        help="Input device index",
+    )
+    parser.add_argument(
+        "--silence-threshold",
+        type=float,
+        default=_DEFAULT_SETTINGS.recording.silence_threshold,
+        help="RMS silence threshold for command recording (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--keywords",
+        type=str,
+        default=None,
+        help="Comma-separated activation keywords (default: clever variants)",
+    )
+    parser.add_argument(
+        "--vad-threshold",
+        type=float,
+        default=_DEFAULT_SETTINGS.vad.threshold,
+        help="Silero VAD speech probability threshold (default: %(default)s)",
+    )
+    parser.add_argument("--debug", action="store_true")
+    # Legacy args (suppressed, kept for backward compat)
+    parser.add_argument("--wake-word", default=None, help=argparse.SUPPRESS)
+    parser.add_argument("--threshold", type=float, default=None, help=argparse.SUPPRESS)
+
+    args = parser.parse_args(list(argv))
+
+    if args.list_devices:
+        import sounddevice as sd
+
+        print(sd.query_devices())
+        raise SystemExit(0)
+
+    keywords: tuple[str, ...]
+    if args.keywords:
+        keywords = tuple(k.strip() for k in args.keywords.split(",") if k.strip())
+    else:
+        keywords = _DEFAULT_SETTINGS.keyword.keywords
+
+    return Settings(
+        audio=AudioConfig(device=args.device),
+        vad=VADConfig(threshold=args.vad_threshold),
+        recording=RecordingConfig(silence_threshold=args.silence_threshold),
+        keyword=KeywordConfig(keywords=keywords),
+        transcription=TranscriptionConfig(whisper_bin=whisper_bin),
+        gateway=GatewayConfig(url=gateway_url, token=gateway_token),
+        tts=TTSConfig(mpv_bin=mpv_bin),
+        debug=args.debug,
+    )
+
+
+_DEFAULT_SETTINGS = Settings()
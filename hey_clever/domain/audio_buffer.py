@@ -1,41 +1,77 @@
-"""Numpy-backed ring buffer for audio chunks."""
+"""Preallocated ring buffer for audio samples."""
 
 from __future__ import annotations
 
-from collections import deque
-
 import numpy as np
 
 
 class AudioBuffer:
-    """Fixed-capacity buffer that evicts oldest chunks when full."""
+    """Fixed-capacity int16 ring buffer that evicts the oldest samples when full.
+
+    Backed by a single preallocated array, so steady-state recording does no
+    allocation and `get_audio` is at most one copy — there is no per-chunk list
+    growth or final O(N) concatenate before transcription.
+    """
 
     def __init__(self, max_duration: float, sample_rate: int) -> None:
         self._max_samples = int(max_duration * sample_rate)
         self._sample_rate = sample_rate
-        self._chunks: deque[np.ndarray] = deque()
-        self._total_samples = 0
+        self._data = np.empty(self._max_samples, dtype=np.int16)
+        self._out: np.ndarray | None = None
+        self._start = 0
+        self._count = 0
 
     @property
     def duration(self) -> float:
-        return self._total_samples / self._sample_rate
+        return self._count / self._sample_rate
 
     @property
     def is_empty(self) -> bool:
-        return self._total_samples == 0
+        return self._count == 0
 
     def add(self, chunk: np.ndarray) -> None:
-        self._chunks.append(chunk)
-        self._total_samples += len(chunk)
-        while self._total_samples > self._max_samples and self._chunks:
-            evicted = self._chunks.popleft()
-            self._total_samples -= len(evicted)
+        n = len(chunk)
+        if n == 0:
+            return
+        if n >= self._max_samples:
+            self._data[:] = chunk[n - self._max_samples :]
+            self._start = 0
+            self._count = self._max_samples
+            return
+
+        end = (self._start + self._count) % self._max_samples
+        first = min(n, self._max_samples - end)
+        self._data[end : end + first] = chunk[:first]
+        if n > first:
+            self._data[: n - first] = chunk[first:]
+
+        overflow = self._count + n - self._max_samples
+        if overflow > 0:
+            self._start = (self._start + overflow) % self._max_samples
+            self._count = self._max_samples
+        else:
+            self._count += n
 
     def get_audio(self) -> np.ndarray:
-        if not self._chunks:
+        """Return the buffered samples, oldest first.
+
+        The returned array is a view into a scratch buffer reused by the next
+        `get_audio` call — consume it (transcribe/copy) before calling again.
+        """
+        if self._count == 0:
             return np.array([], dtype=np.int16)
-        return np.concatenate(list(self._chunks))
+        if self._out is None:
+            self._out = np.empty(self._max_samples, dtype=np.int16)
+        out = self._out[: self._count]
+        end = self._start + self._count
+        if end <= self._max_samples:
+            out[:] = self._data[self._start : end]
+        else:
+            split = self._max_samples - self._start
+            out[:split] = self._data[self._start :]
+            out[split:] = self._data[: end - self._max_samples]
+        return out
 
     def clear(self) -> None:
-        self._chunks.clear()
-        self._total_samples = 0
+        self._start = 0
+        self._count = 0
@@ -2,12 +2,18 @@
 
 from __future__ import annotations
 
-from enum import Enum
+from enum import IntEnum
 
 
-class DetectorState(Enum):
-    IDLE = "idle"
-    LISTENING = "listening"
-    ACTIVATED = "activated"
-    PROCESSING = "processing"
-    RESPONDING = "responding"
+class DetectorState(IntEnum):
+    """State machine states as an IntEnum.
+
+    Comparisons in the per-block dispatch loop are plain C integer compares
+    instead of Enum descriptor lookups; use ``.name`` for human-readable logs.
+    """
+
+    IDLE = 0
+    LISTENING = 1
+    ACTIVATED = 2
+    PROCESSING = 3
+    RESPONDING = 4
@@ -2,52 +2,208 @@
 
 from __future__ import annotations
 
+import logging
 import os
 import sys
+from collections import deque
+from functools import lru_cache
 from pathlib import Path
 
 import numpy as np
 import onnxruntime
 
+log = logging.getLogger(__name__)
+
 SAMPLE_RATE = 16000
 
+# Adaptive energy gate: track block peaks over ~5s of 32ms blocks and refresh
+# the noise-floor estimate every 32 blocks (~1s).
+_GATE_WINDOW_BLOCKS = 156
+_GATE_UPDATE_INTERVAL = 32
+
+
+def _quantized_model_path(model_path: str) -> str:
+    """Return an int8-quantized copy of the model, converting once and caching on disk.
+
+    Falls back to the fp32 model when the quantization tooling (onnx) is
+    unavailable or the model directory is read-only.
+    """
+    int8_path = model_path + ".int8.onnx"
+    if os.path.exists(int8_path):
+        return int8_path
+    try:
+        from onnxruntime.quantization import QuantType, quantize_dynamic
+
+        quantize_dynamic(model_path, int8_path, weight_type=QuantType.QInt8)
+        log.info("Quantized VAD model cached at: %s", int8_path)
+        return int8_path
+    except Exception as e:
+        log.debug("VAD int8 quantization unavailable (%s), using fp32 model", e)
+        return model_path
+
 
 class SileroVAD:
     """Stateful Silero VAD with LSTM hidden states."""
 
-    def __init__(self, model_path: str, threshold: float = 0.4) -> None:
+    # Sample rate never changes — share one tensor across instances and calls.
+    _SR = np.array(SAMPLE_RATE, dtype=np.int64)
+
+    def __init__(self, model_path: str, threshold: float = 0.4, energy_gate: float = 100.0) -> None:
         self.threshold = threshold
+        self.energy_gate = energy_gate
+        self._gate = energy_gate
+        self._peaks: deque[int] = deque(maxlen=_GATE_WINDOW_BLOCKS)
+        self._blocks_since_gate_update = 0
+        # Adaptive threshold: probabilities from non-speech blocks form a noise
+        # floor; the effective threshold rides above it in noisy rooms so
+        # ambient noise stops false-triggering the keyword pipeline.
+        self._noise_probs: deque[float] = deque(maxlen=_GATE_WINDOW_BLOCKS)
+        self._probs_since_update = 0
+        self._effective_threshold = threshold
         opts = onnxruntime.SessionOptions()
         opts.inter_op_num_threads = 1
         opts.intra_op_num_threads = 1
-        self._session = onnxruntime.InferenceSession(model_path, sess_options=opts)
-        self.reset()
+        opts.graph_optimization_level = onnxruntime.GraphOptimizationLevel.ORT_ENABLE_ALL
+        opts.execution_mode = onnxruntime.ExecutionMode.ORT_SEQUENTIAL
+        # Don't spin-wait for work between 32ms blocks — the VAD would pin a core.
+        opts.add_session_config_entry("session.intra_op.allow_spinning", "0")
+        # Explicit provider list skips ORT's default probing; OpenVINO is
+        # preferred when the build ships it (VNNI int8 dot products on Intel).
+        available = onnxruntime.get_available_providers()
+        providers = [
+            p for p in ("OpenVINOExecutionProvider", "CPUExecutionProvider") if p in available
+        ] or ["CPUExecutionProvider"]
+        load_path = _quantized_model_path(model_path)
+        try:
+            self._session = onnxruntime.InferenceSession(
+                load_path, sess_options=opts, providers=providers
+            )
+        except Exception:
+            # A truncated quantized cache (e.g. interrupted conversion) must
+            # not brick startup — drop it and load the original model.
+            if load_path == model_path:
+                raise
+            log.warning("Quantized VAD model unusable, falling back to: %s", model_path)
+            try:
+                os.unlink(load_path)
+            except OSError:
+                pass
+            self._session = onnxruntime.InferenceSession(
+                model_path, sess_options=opts, providers=providers
+            )
+        # h and c live as views into one contiguous float32 block (and likewise
+        # for the output states), so the LSTM state is a single allocation that
+        # the IOBinding addresses never change for.
+        self._state = np.zeros(2 * 2 * 64, dtype=np.float32)
+        self._h = self._state[:128].reshape(2, 1, 64)
+        self._c = self._state[128:].reshape(2, 1, 64)
+        self._scratch: np.ndarray | None = None
+        self._io: onnxruntime.IOBinding | None = None
 
     def reset(self) -> None:
-        self._h = np.zeros((2, 1, 64), dtype=np.float32)
-        self._c = np.zeros((2, 1, 64), dtype=np.float32)
-        self._sr = np.array(SAMPLE_RATE, dtype=np.int64)
+        # Zero in place — reset runs after every utterance, and fresh np.zeros
+        # allocations here just churn the allocator. The IOBinding shares these
+        # buffers, so no rebind is needed.
+        self._state.fill(0)
+
+    def _bind_io(self, n_samples: int) -> None:
+        """Bind all inputs/outputs to preallocated buffers, reused every call.
+
+        session.run() re-wraps each numpy feed as an OrtValue and allocates
+        fresh output arrays per call; with IOBinding the per-block inference is
+        a single run_with_iobinding plus two tiny hidden-state copies.
+        """
+        from onnxruntime import OrtValue
+
+        self._scratch = np.empty((1, n_samples), dtype=np.float32)
+        self._prob_out = np.empty((1, 1), dtype=np.float32)
+        self._state_out = np.empty_like(self._state)
+        self._h_out = self._state_out[:128].reshape(2, 1, 64)
+        self._c_out = self._state_out[128:].reshape(2, 1, 64)
+
+        io = self._session.io_binding()
+        io.bind_ortvalue_input("input", OrtValue.ortvalue_from_numpy(self._scratch))
+        io.bind_ortvalue_input("h", OrtValue.ortvalue_from_numpy(self._h))
+        io.bind_ortvalue_input("c", OrtValue.ortvalue_from_numpy(self._c))
+        io.bind_ortvalue_input("sr", OrtValue.ortvalue_from_numpy(self._SR))
+        out_names = [o.name for o in self._session.get_outputs()]
+        io.bind_ortvalue_output(out_names[0], OrtValue.ortvalue_from_numpy(self._prob_out))
+        io.bind_ortvalue_output(out_names[1], OrtValue.ortvalue_from_numpy(self._h_out))
+        io.bind_ortvalue_output(out_names[2], OrtValue.ortvalue_from_numpy(self._c_out))
+        self._io = io
 
     def probability(self, audio_chunk: np.ndarray) -> float:
-        """Run VAD on a chunk and return speech probability."""
-        if audio_chunk.dtype == np.int16:
-            audio = audio_chunk.astype(np.float32) / 32767.0
-        else:
-            audio = audio_chunk.astype(np.float32)
-
-        audio = audio.reshape(1, -1)
-        ort_inputs = {"input": audio, "h": self._h, "c": self._c, "sr": self._sr}
-        out, h_new, c_new = self._session.run(None, ort_inputs)
-        self._h = h_new
-        self._c = c_new
-        return float(out[0][0])
+        """Run VAD on an int16 chunk and return speech probability.
 
-    def is_speech(self, audio_chunk: np.ndarray) -> bool:
-        return self.probability(audio_chunk) >= self.threshold
+        Audio reaches here from exactly one producer (SoundDeviceInput's int16
+        stream), so the chunk is normalized unconditionally — no per-call dtype
+        dispatch.
+        """
+        if self._io is None or self._scratch is None or self._scratch.shape[1] != audio_chunk.size:
+            self._bind_io(audio_chunk.size)
+            assert self._scratch is not None
+
+        # Fused normalize-into-scratch: no intermediate float array per block.
+        np.multiply(audio_chunk, np.float32(1.0 / 32768.0), out=self._scratch[0])
 
+        self._session.run_with_iobinding(self._io)
+        # One contiguous copy carries both h and c forward.
+        np.copyto(self._state, self._state_out)
+        return float(self._prob_out[0, 0])
 
+    def is_speech(self, audio_chunk: np.ndarray) -> bool:
+        # Obviously-silent blocks skip the ONNX call entirely — on an always-on
+        # assistant that's the overwhelmingly common case. The gate adapts as
+        # the 5th percentile of recent block peaks (floored at energy_gate),
+        # and skipping leaves the LSTM state untouched for the next real block.
+        if audio_chunk.size:
+            peak = max(int(audio_chunk.max()), -int(audio_chunk.min()))
+            self._peaks.append(peak)
+            self._blocks_since_gate_update += 1
+            if self._blocks_since_gate_update >= _GATE_UPDATE_INTERVAL:
+                self._blocks_since_gate_update = 0
+                self._gate = max(self.energy_gate, float(np.percentile(self._peaks, 5)))
+            if peak < self._gate:
+                return False
+
+        prob = self.probability(audio_chunk)
+        if prob < self.threshold:
+            self._noise_probs.append(prob)
+            self._probs_since_update += 1
+            if self._probs_since_update >= _GATE_UPDATE_INTERVAL:
+                self._probs_since_update = 0
+                self._effective_threshold = max(
+                    self.threshold, float(np.quantile(self._noise_probs, 0.95)) + 0.1
+                )
+        return prob >= self._effective_threshold
+
+
+@lru_cache(maxsize=1)
 def find_silero_vad_model() -> str:
-    """Locate the Silero VAD ONNX model bundled with openwakeword."""
+    """Locate the Silero VAD ONNX model bundled with openwakeword.
+
+    The sys.prefix fallback walks the whole venv, so the resolved path is
+    memoized in-process and persisted under ~/.cache so cold starts skip the
+    walk too.
+    """
+    cache_file = Path.home() / ".cache" / "hey-clever" / "vad_path"
+    try:
+        cached = cache_file.read_text().strip()
+        if cached and os.path.exists(cached):
+            return cached
+    except OSError:
+        pass
+
+    path = _search_silero_vad_model()
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        cache_file.write_text(path)
+    except OSError:
+        pass
+    return path
+
+
+def _search_silero_vad_model() -> str:
     try:
         import openwakeword
 
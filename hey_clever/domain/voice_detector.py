@@ -3,7 +3,11 @@
 from __future__ import annotations
 
 import logging
+import queue
+import threading
 import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 
 import numpy as np
 
@@ -20,9 +24,9 @@ from hey_clever.ports.tts import ITTS
 
 log = logging.getLogger(__name__)
 
-
-def _rms(block: np.ndarray) -> float:
-    return float(np.sqrt(np.mean(block.astype(np.float64) ** 2)))
+# Trailing window for command silence detection — energy over ~200ms instead of
+# a single block, so a one-block dip doesn't reset the silence timer.
+_RMS_WINDOW_SEC = 0.2
 
 
 class VoiceDetector:
@@ -59,17 +63,67 @@ class VoiceDetector:
             sample_rate=settings.audio.sample_rate,
         )
 
+        window_blocks = max(
+            1, round(_RMS_WINDOW_SEC * settings.audio.sample_rate / settings.audio.block_size)
+        )
+        # (sum_of_squares, n_samples) per block — integers only on the hot path
+        self._sq_window: deque[tuple[int, int]] = deque(maxlen=window_blocks)
+        # Comparing mean-square against threshold² is monotone-equivalent to
+        # comparing RMS against the threshold, without the per-block sqrt.
+        self._silence_thresh_sq = settings.recording.silence_threshold**2
+
+        # None is the worker's shutdown sentinel
+        self._vad_queue: queue.Queue[tuple[np.ndarray, bool] | None] = queue.Queue()
+        self._vad_thread: threading.Thread | None = None
+
+        # Keyword-spotting stage: audio snapshots in, (seq, detected) out.
+        # maxsize=1 gives backpressure — at most one check in flight.
+        self._kw_check_queue: queue.Queue[tuple[int, np.ndarray]] = queue.Queue(maxsize=1)
+        self._kw_result_queue: queue.Queue[tuple[int, bool]] = queue.Queue()
+        self._kw_thread: threading.Thread | None = None
+        self._kw_seq = 0
+
+        # Gateway round-trip + TTS run off the main loop (started in start());
+        # direct _process_command calls without the pipeline stay synchronous.
+        self._response_executor: ThreadPoolExecutor | None = None
+        self._response_future: Future[None] | None = None
+
         self.state = DetectorState.IDLE
         self.running = False
+        # Cached once per start(); debug logs on the per-block path shouldn't
+        # even build their argument tuples when the level is off.
+        self._debug = log.isEnabledFor(logging.DEBUG)
+
+        # Per-chunk dispatch is one tuple index on the IntEnum value instead of
+        # a chain of enum comparisons. PROCESSING/RESPONDING consume no audio.
+        self._handlers = (
+            self._handle_idle,
+            self._handle_listening,
+            self._handle_activated,
+            None,
+            None,
+        )
 
     def start(self) -> None:
         if self.running:
             return
         self.running = True
         self.state = DetectorState.IDLE
+        self._debug = log.isEnabledFor(logging.DEBUG)
         log.info("Voice detector started")
         try:
             self._audio.start_stream()
+            self._vad_thread = threading.Thread(
+                target=self._vad_worker, name="vad-worker", daemon=True
+            )
+            self._vad_thread.start()
+            self._kw_thread = threading.Thread(
+                target=self._kw_worker, name="kw-worker", daemon=True
+            )
+            self._kw_thread.start()
+            self._response_executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="response"
+            )
             self._main_loop()
         except KeyboardInterrupt:
             log.info("Interrupted")
@@ -81,43 +135,105 @@ class VoiceDetector:
             return
         self.running = False
         self._audio.stop_stream()
+        if self._vad_thread is not None:
+            self._vad_thread.join(timeout=2.0)
+            self._vad_thread = None
+        if self._kw_thread is not None:
+            self._kw_thread.join(timeout=2.0)
+            self._kw_thread = None
+        if self._response_executor is not None:
+            self._response_executor.shutdown(wait=False)
+            self._response_executor = None
         self._vad.reset()
         self._kw_buffer.clear()
         self._cmd_buffer.clear()
         log.info("Voice detector stopped")
 
+    def _vad_worker(self) -> None:
+        """Consume raw audio and publish (chunk, is_speech) to the main loop.
+
+        Running Silero on its own thread overlaps the ~5-15ms ONNX inference
+        with audio arrival instead of serializing them. VAD is only consulted
+        in IDLE/LISTENING, so inference is skipped while recording/responding.
+        """
+        # Hoist the per-block attribute lookups out of the loop.
+        read_chunk = self._audio.read_chunk
+        vad_is_speech = self._vad.is_speech
+        publish = self._vad_queue.put
+        while self.running:
+            try:
+                chunk = read_chunk()
+                if chunk is None:
+                    continue
+                if self.state in (DetectorState.IDLE, DetectorState.LISTENING):
+                    is_speech = vad_is_speech(chunk)
+                else:
+                    is_speech = False
+                publish((chunk, is_speech))
+            except (Exception, KeyboardInterrupt):
+                log.debug("VAD worker stopping", exc_info=True)
+                self._vad_queue.put(None)
+                return
+
     def _main_loop(self) -> None:
         log.info("=== Hey Clever is listening! Say 'Clever' to activate. ===")
+        consume = self._vad_queue.get
         while self.running:
-            chunk = self._audio.read_chunk()
-            if chunk is None:
-                time.sleep(0.01)
+            try:
+                item = consume(timeout=1.0)
+            except queue.Empty:
                 continue
-
-            if self.state == DetectorState.IDLE:
-                self._handle_idle(chunk)
-            elif self.state == DetectorState.LISTENING:
-                self._handle_listening(chunk)
-            elif self.state == DetectorState.ACTIVATED:
-                self._handle_activated(chunk)
+            if item is None:
+                break
+            chunk, is_speech = item
+
+            handler = self._handlers[self.state]
+            if handler is not None:
+                handler(chunk, is_speech)
+
+    def _drain_vad_queue(self) -> None:
+        """Discard chunks queued before a mute/cue so stale audio isn't replayed."""
+        while True:
+            try:
+                self._vad_queue.get_nowait()
+            except queue.Empty:
+                return
 
     # -- State handlers --
 
-    def _handle_idle(self, chunk: np.ndarray) -> None:
-        if self._vad.is_speech(chunk):
+    def _handle_idle(self, chunk: np.ndarray, is_speech: bool | None = None) -> None:
+        if is_speech is None:
+            is_speech = self._vad.is_speech(chunk)
+        if is_speech:
             self._kw_buffer.add(chunk)
             self.state = DetectorState.LISTENING
             self._silence_start: float | None = None
-            log.debug("VAD: speech started")
+            self._last_partial_check = 0.0
+            if self._debug:
+                log.debug("VAD: speech started")
+
+    def _handle_listening(self, chunk: np.ndarray, is_speech: bool | None = None) -> None:
+        if self._poll_kw_results():
+            self._enter_activated()
+            return
 
-    def _handle_listening(self, chunk: np.ndarray) -> None:
-        is_speech = self._vad.is_speech(chunk)
+        if is_speech is None:
+            is_speech = self._vad.is_speech(chunk)
         self._kw_buffer.add(chunk)
 
         if is_speech:
             self._silence_start = None
             if self._kw_buffer.duration >= self._settings.vad.max_buffer_sec:
                 self._check_keyword()
+            elif (
+                self._kw_buffer.duration - self._last_partial_check
+                >= self._settings.vad.partial_check_interval
+            ):
+                # Check mid-utterance so the beep fires as soon as the keyword
+                # is heard, instead of waiting out the trailing silence. Only
+                # runs on speech blocks, so silence never triggers extra work.
+                self._last_partial_check = self._kw_buffer.duration
+                self._check_keyword_partial()
             return
 
         if self._silence_start is None:
@@ -126,36 +242,151 @@ class VoiceDetector:
             if self._kw_buffer.duration >= self._settings.vad.min_speech_duration:
                 self._check_keyword()
             else:
-                log.debug("Speech too short (%.2fs), ignoring", self._kw_buffer.duration)
+                if self._debug:
+                    log.debug("Speech too short (%.2fs), ignoring", self._kw_buffer.duration)
                 self._reset_to_idle()
 
-    def _check_keyword(self) -> None:
-        audio = self._kw_buffer.get_audio()
+    def _kw_worker(self) -> None:
+        """Transcribe keyword-check snapshots off the main loop.
+
+        Whisper-tiny runs here so listening never stalls behind a partial
+        check; the main loop keeps consuming VAD output while a check is in
+        flight and picks the verdict up from the result queue.
+        """
+        while self.running:
+            try:
+                seq, audio = self._kw_check_queue.get(timeout=1.0)
+            except queue.Empty:
+                continue
+            try:
+                self._kw_result_queue.put((seq, self._detect_keyword(audio)))
+            except Exception:
+                log.exception("Keyword worker failed")
+                self._kw_result_queue.put((seq, False))
+
+    def _kw_worker_alive(self) -> bool:
+        return self._kw_thread is not None and self._kw_thread.is_alive()
+
+    def _submit_kw_check(self, block: bool) -> int | None:
+        """Queue a snapshot for the keyword stage; returns its seq, or None if busy."""
+        self._kw_seq += 1
+        snapshot = self._kw_buffer.get_audio().copy()
+        try:
+            if block:
+                self._kw_check_queue.put((self._kw_seq, snapshot), timeout=5.0)
+            else:
+                self._kw_check_queue.put_nowait((self._kw_seq, snapshot))
+        except queue.Full:
+            return None
+        return self._kw_seq
+
+    def _poll_kw_results(self) -> bool:
+        """True if any completed keyword check detected the keyword."""
+        detected = False
+        while True:
+            try:
+                _seq, hit = self._kw_result_queue.get_nowait()
+            except queue.Empty:
+                return detected
+            detected = detected or hit
+
+    def _drain_kw_results(self) -> None:
+        while True:
+            try:
+                self._kw_result_queue.get_nowait()
+            except queue.Empty:
+                return
+
+    def _detect_keyword(self, audio: np.ndarray | None = None) -> bool:
+        if audio is None:
+            audio = self._kw_buffer.get_audio()
         text = self._kw_transcription.transcribe(audio)
-        log.debug("Whisper tiny heard: '%s'", text)
+        if self._debug:
+            log.debug("Whisper tiny heard: '%s'", text)
 
         detected, confidence = self._keyword.detect(text)
         if detected:
             log.info("🎤 Keyword detected (%.0f%%) in: '%s'", confidence * 100, text)
-            self._enter_activated()
-        else:
+        return detected
+
+    def _check_keyword(self) -> None:
+        if not self._kw_worker_alive():
+            # Direct-call path (no pipeline running): decide synchronously.
+            if self._detect_keyword():
+                self._enter_activated()
+            else:
+                if self._debug:
+                    log.debug("No keyword found, continuing")
+                self._reset_to_idle()
+            return
+
+        seq = self._submit_kw_check(block=True)
+        deadline = time.monotonic() + 10.0
+        while time.monotonic() < deadline:
+            try:
+                rseq, detected = self._kw_result_queue.get(timeout=0.1)
+            except queue.Empty:
+                continue
+            # Any hit on this utterance activates, even from an earlier
+            # partial check that completed late.
+            if detected:
+                self._enter_activated()
+                return
+            if seq is None or rseq >= seq:
+                break
+        if self._debug:
             log.debug("No keyword found, continuing")
-            self._reset_to_idle()
+        self._reset_to_idle()
+
+    def _check_keyword_partial(self) -> bool:
+        """Keyword check on the in-progress utterance; a miss keeps listening."""
+        if self._kw_worker_alive():
+            # Hand the snapshot to the keyword stage; skip if one is in flight.
+            self._submit_kw_check(block=False)
+            return False
+        if self._detect_keyword():
+            self._enter_activated()
+            return True
+        return False
 
     def _enter_activated(self) -> None:
         self.state = DetectorState.ACTIVATED
         self._audio.set_muted(True)
         self._cues.on_keyword_detected()
         self._audio.set_muted(False)
+        self._drain_vad_queue()
+        self._drain_kw_results()
         self._cmd_buffer.clear()
+        self._sq_window.clear()
         self._cmd_silence_start: float | None = None
         self._cmd_got_speech = False
 
-    def _handle_activated(self, chunk: np.ndarray) -> None:
+    def _handle_activated(self, chunk: np.ndarray, is_speech: bool | None = None) -> None:
+        # is_speech is unused — recording relies on the energy window below —
+        # but the signature matches the dispatch table.
         self._cmd_buffer.add(chunk)
-        block_rms = _rms(chunk)
 
-        if block_rms > self._settings.recording.silence_threshold:
+        # Before any speech arrives, a cheap min/max gate skips the sum-of-squares
+        # kernel on obviously-silent blocks (|sample| < threshold/2 implies RMS
+        # below threshold).
+        half_thresh = self._settings.recording.silence_threshold / 2
+        if (
+            not self._cmd_got_speech
+            and chunk.size
+            and -half_thresh < chunk.min()
+            and chunk.max() < half_thresh
+        ):
+            block_ss = 0
+        else:
+            b = chunk.astype(np.int64, copy=False)
+            block_ss = int(np.dot(b, b))
+
+        self._sq_window.append((block_ss, chunk.size))
+        total_ss = sum(ss for ss, _ in self._sq_window)
+        total_n = sum(n for _, n in self._sq_window)
+        window_mean_sq = total_ss / total_n if total_n else 0.0
+
+        if window_mean_sq > self._silence_thresh_sq:
             self._cmd_got_speech = True
             self._cmd_silence_start = None
         elif self._cmd_got_speech:
@@ -194,20 +425,41 @@ class VoiceDetector:
         log.info("Transcribed: '%s'", text)
         self._cues.on_processing()
 
-        response = self._gateway.send(text)
-        log.info("Response: '%s'", response[:200])
-
         self.state = DetectorState.RESPONDING
-        self._cues.on_response_ready()
-        self._audio.set_muted(True)
-        self._tts.speak(response)
-        self._audio.set_muted(False)
+        if self._response_executor is not None:
+            self._response_future = self._response_executor.submit(self._respond, text)
+        else:
+            self._respond(text)
 
-        log.info("=== Ready for next keyword ===")
-        self._reset_to_idle()
+    def _respond(self, text: str) -> None:
+        """Gateway round-trip and TTS playback, off the main loop when started.
+
+        The main loop keeps draining audio while the response is in flight
+        (RESPONDING consumes none of it), so the detector is responsive again
+        the moment TTS finishes instead of after a blocked loop catches up.
+        """
+        try:
+            response = self._gateway.send(text)
+            log.info("Response: '%s'", response[:200])
+
+            self._cues.on_response_ready()
+            self._audio.set_muted(True)
+            self._tts.speak(response)
+            self._audio.set_muted(False)
+            self._drain_vad_queue()
+            log.info("=== Ready for next keyword ===")
+        except Exception:
+            log.exception("Response pipeline failed")
+        finally:
+            self._reset_to_idle()
 
     def _reset_to_idle(self) -> None:
-        self.state = DetectorState.IDLE
+        # State is published last: _reset_to_idle may run on the response
+        # thread, and while the state still reads RESPONDING neither the main
+        # loop (buffer appends) nor the VAD worker (inference against the
+        # hidden state being zeroed) touches these structures.
+        self._drain_kw_results()
         self._kw_buffer.clear()
         self._cmd_buffer.clear()
         self._vad.reset()
+        self.state = DetectorState.IDLE
@@ -1,4 +1,4 @@
-"""Port interfaces (ABCs) for the hexagonal architecture."""
+"""Port interfaces (structural protocols) for the hexagonal architecture."""
 
 from hey_clever.ports.audio_input import IAudioInput
 from hey_clever.ports.gateway import IGateway
@@ -1,26 +1,26 @@
 from __future__ import annotations
 
-from abc import ABC, abstractmethod
+from typing import Protocol, runtime_checkable
 
 import numpy as np
 
 
-class IAudioInput(ABC):
-    @abstractmethod
+@runtime_checkable
+class IAudioInput(Protocol):
     def start_stream(self) -> None: ...
 
-    @abstractmethod
     def stop_stream(self) -> None: ...
 
-    @abstractmethod
     def read_chunk(self) -> np.ndarray | None:
-        """Returns None on timeout."""
+        """Return the next audio block, or None on timeout.
+
+        Contract: blocks are C-contiguous 1-D int16 arrays of block_size
+        samples. Consumers (VAD normalization, energy kernels, WAV writing)
+        rely on this and skip defensive dtype/contiguity conversions.
+        """
 
-    @abstractmethod
     def get_sample_rate(self) -> int: ...
 
-    @abstractmethod
     def is_muted(self) -> bool: ...
 
-    @abstractmethod
     def set_muted(self, muted: bool) -> None: ...
@@ -1,8 +1,8 @@
 from __future__ import annotations
 
-from abc import ABC, abstractmethod
+from typing import Protocol, runtime_checkable
 
 
-class IGateway(ABC):
-    @abstractmethod
+@runtime_checkable
+class IGateway(Protocol):
     def send(self, message: str, context: list[dict[str, str]] | None = None) -> str: ...
@@ -1,12 +1,11 @@
 from __future__ import annotations
 
-from abc import ABC, abstractmethod
+from typing import Protocol, runtime_checkable
 
 
-class IKeywordDetector(ABC):
-    @abstractmethod
+@runtime_checkable
+class IKeywordDetector(Protocol):
     def detect(self, text: str) -> tuple[bool, float]:
         """Returns (detected, confidence)."""
 
-    @abstractmethod
     def get_keywords(self) -> tuple[str, ...]: ...
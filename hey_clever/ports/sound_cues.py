@@ -1,17 +1,14 @@
 from __future__ import annotations
 
-from abc import ABC, abstractmethod
+from typing import Protocol, runtime_checkable
 
 
-class ISoundCues(ABC):
-    @abstractmethod
+@runtime_checkable
+class ISoundCues(Protocol):
     def on_keyword_detected(self) -> None: ...
 
-    @abstractmethod
     def on_recording_done(self) -> None: ...
 
-    @abstractmethod
     def on_processing(self) -> None: ...
 
-    @abstractmethod
     def on_response_ready(self) -> None: ...
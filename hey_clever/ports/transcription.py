@@ -1,10 +1,10 @@
 from __future__ import annotations
 
-from abc import ABC, abstractmethod
+from typing import Protocol, runtime_checkable
 
 import numpy as np
 
 
-class ITranscription(ABC):
-    @abstractmethod
+@runtime_checkable
+class ITranscription(Protocol):
     def transcribe(self, audio: np.ndarray) -> str: ...
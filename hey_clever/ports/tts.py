@@ -1,15 +1,13 @@
 from __future__ import annotations
 
-from abc import ABC, abstractmethod
+from typing import Protocol, runtime_checkable
 
 
-class ITTS(ABC):
-    @abstractmethod
+@runtime_checkable
+class ITTS(Protocol):
     def speak(self, text: str) -> bool:
         """Returns True if interrupted."""
 
-    @abstractmethod
     def stop(self) -> None: ...
 
-    @abstractmethod
     def is_speaking(self) -> bool: ...
@@ -38,6 +38,22 @@ class TestAudioBuffer:
         audio = buf.get_audio()
         assert len(audio) <= 1600 + 512  # at most one chunk over
 
+    def test_eviction_keeps_newest_samples(self):
+        buf = AudioBuffer(max_duration=0.1, sample_rate=16000)
+        # 1600 samples max; fill with ascending values so order is checkable
+        buf.add(np.arange(1000, dtype=np.int16))
+        buf.add(np.arange(1000, 2000, dtype=np.int16))
+        audio = buf.get_audio()
+        assert len(audio) == 1600
+        np.testing.assert_array_equal(audio, np.arange(400, 2000, dtype=np.int16))
+
+    def test_chunk_larger_than_capacity(self):
+        buf = AudioBuffer(max_duration=0.1, sample_rate=16000)
+        buf.add(np.arange(5000, dtype=np.int16))
+        audio = buf.get_audio()
+        assert len(audio) == 1600
+        np.testing.assert_array_equal(audio, np.arange(3400, 5000, dtype=np.int16))
+
     def test_clear(self):
         buf = AudioBuffer(max_duration=5.0, sample_rate=16000)
         buf.add(np.ones(512, dtype=np.int16))
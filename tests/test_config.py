@@ -19,7 +19,7 @@ class TestAudioConfig:
         cfg = AudioConfig()
         assert cfg.sample_rate == 16000
         assert cfg.channels == 1
-        assert cfg.block_size == 512
+        assert cfg.block_size == 1024
         assert cfg.device is None
 
     def test_frozen(self):
@@ -101,6 +101,13 @@ class TestSettings:
         assert s.debug is False
         assert s.audio.device is None
 
+    def test_from_args_matches_defaults(self, monkeypatch):
+        # Every default must come through as a real value (slots=True turns
+        # class-attribute reads into member descriptors).
+        for var in ("WHISPER_BIN", "CLAWDBOT_GATEWAY_URL", "CLAWDBOT_GATEWAY_TOKEN", "MPV_BIN"):
+            monkeypatch.delenv(var, raising=False)
+        assert Settings.from_args([]) == Settings.default()
+
     def test_from_args_debug(self):
         s = Settings.from_args(["--debug"])
         assert s.debug is True
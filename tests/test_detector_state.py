@@ -5,11 +5,15 @@ from hey_clever.domain.detector_state import DetectorState
 
 class TestDetectorState:
     def test_all_states_exist(self):
-        assert DetectorState.IDLE.value == "idle"
-        assert DetectorState.LISTENING.value == "listening"
-        assert DetectorState.ACTIVATED.value == "activated"
-        assert DetectorState.PROCESSING.value == "processing"
-        assert DetectorState.RESPONDING.value == "responding"
+        assert DetectorState.IDLE.name.lower() == "idle"
+        assert DetectorState.LISTENING.name.lower() == "listening"
+        assert DetectorState.ACTIVATED.name.lower() == "activated"
+        assert DetectorState.PROCESSING.name.lower() == "processing"
+        assert DetectorState.RESPONDING.name.lower() == "responding"
+
+    def test_int_comparisons(self):
+        assert DetectorState.IDLE == 0
+        assert DetectorState.RESPONDING == 4
 
     def test_state_count(self):
         assert len(DetectorState) == 5
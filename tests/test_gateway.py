@@ -1,5 +1,6 @@
 """Tests for Clawdbot gateway adapter."""
 
+import json
 from unittest.mock import MagicMock, patch
 
 from hey_clever.adapters.clawdbot_gateway import ClawdbotGateway
@@ -12,54 +13,51 @@ def _make_gateway(
     return ClawdbotGateway(GatewayConfig(url=url, token=token))
 
 
-class TestClawdbotGateway:
-    @patch("hey_clever.adapters.clawdbot_gateway.requests.post")
-    def test_send_success(self, mock_post):
-        mock_resp = MagicMock()
-        mock_resp.json.return_value = {"choices": [{"message": {"content": "Hello there!"}}]}
-        mock_resp.raise_for_status = MagicMock()
-        mock_post.return_value = mock_resp
+def _mock_response(content: str) -> MagicMock:
+    body = {"choices": [{"message": {"content": content}}]}
+    mock_resp = MagicMock()
+    mock_resp.json.return_value = body
+    mock_resp.content = json.dumps(body).encode()
+    mock_resp.raise_for_status = MagicMock()
+    return mock_resp
+
+
+def _sent_payload(mock_post: MagicMock) -> dict:
+    """Request body regardless of whether the orjson or stdlib path was taken."""
+    kwargs = mock_post.call_args[1]
+    if "json" in kwargs:
+        return kwargs["json"]
+    return json.loads(kwargs["data"])
+
 
+class TestClawdbotGateway:
+    def test_send_success(self):
         gw = _make_gateway()
-        result = gw.send("hi")
+        with patch.object(gw._session, "post", return_value=_mock_response("Hello there!")) as p:
+            result = gw.send("hi")
         assert result == "Hello there!"
 
-        url_arg = mock_post.call_args[0][0]
+        url_arg = p.call_args[0][0]
         assert "v1/chat/completions" in url_arg
 
-    @patch("hey_clever.adapters.clawdbot_gateway.requests.post")
-    def test_send_includes_auth_header(self, mock_post):
-        mock_resp = MagicMock()
-        mock_resp.json.return_value = {"choices": [{"message": {"content": "ok"}}]}
-        mock_resp.raise_for_status = MagicMock()
-        mock_post.return_value = mock_resp
-
+    def test_session_has_auth_headers(self):
         gw = _make_gateway(token="secret-123")
-        gw.send("test")
+        assert gw._session.headers["Authorization"] == "Bearer secret-123"
+        assert gw._session.headers["x-clawdbot-agent-id"] == "main"
 
-        headers = mock_post.call_args[1].get("headers") or mock_post.call_args.kwargs.get("headers")
-        assert headers["Authorization"] == "Bearer secret-123"
-        assert headers["x-clawdbot-agent-id"] == "main"
-
-    @patch("hey_clever.adapters.clawdbot_gateway.requests.post")
-    def test_send_failure_returns_error_message(self, mock_post):
-        mock_post.side_effect = Exception("connection refused")
+    def test_send_failure_returns_error_message(self):
         gw = _make_gateway()
-        result = gw.send("hi")
+        with patch.object(gw._session, "post", side_effect=Exception("connection refused")):
+            result = gw.send("hi")
         assert "sorry" in result.lower() or "couldn't" in result.lower()
 
-    @patch("hey_clever.adapters.clawdbot_gateway.requests.post")
-    def test_send_with_context(self, mock_post):
-        mock_resp = MagicMock()
-        mock_resp.json.return_value = {"choices": [{"message": {"content": "context reply"}}]}
-        mock_resp.raise_for_status = MagicMock()
-        mock_post.return_value = mock_resp
-
+    def test_send_with_context(self):
         gw = _make_gateway()
         ctx = [{"role": "system", "content": "You are helpful."}]
-        result = gw.send("hi", context=ctx)
+        with patch.object(gw._session, "post", return_value=_mock_response("context reply")) as p:
+            result = gw.send("hi", context=ctx)
         assert result == "context reply"
 
-        payload = mock_post.call_args[1]["json"]
+        payload = _sent_payload(p)
         assert len(payload["messages"]) == 2
         assert payload["messages"][0]["role"] == "system"
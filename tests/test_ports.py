@@ -1,4 +1,4 @@
-"""Tests verifying port interfaces are proper ABCs that cannot be instantiated."""
+"""Tests verifying port protocols cannot be instantiated directly."""
 
 import pytest
 
@@ -7,6 +7,7 @@ import numpy as np
 
 from hey_clever.adapters.whisper_transcription import (
     WhisperCLITranscription,
+    WhisperSmallTranscription,
     WhisperTinyTranscription,
 )
 from hey_clever.config.settings import TranscriptionConfig
@@ -63,6 +64,34 @@ class TestWhisperTinyTranscription:
         assert abs(call_args[0] - 1.0) < 0.001
 
 
+class TestWhisperSmallTranscription:
+    def test_transcribe_success(self):
+        mock_model = MagicMock()
+        seg = MagicMock()
+        seg.text = "turn on the lights"
+        mock_model.transcribe.return_value = ([seg], None)
+
+        adapter = WhisperSmallTranscription(TranscriptionConfig(), model=mock_model)
+        result = adapter.transcribe(np.zeros(16000, dtype=np.int16))
+        assert result == "turn on the lights"
+
+    def test_transcribe_error(self):
+        mock_model = MagicMock()
+        mock_model.transcribe.side_effect = RuntimeError("model error")
+
+        adapter = WhisperSmallTranscription(TranscriptionConfig(), model=mock_model)
+        result = adapter.transcribe(np.zeros(16000, dtype=np.int16))
+        assert result == ""
+
+    def test_uses_configured_language(self):
+        mock_model = MagicMock()
+        mock_model.transcribe.return_value = ([], None)
+
+        adapter = WhisperSmallTranscription(TranscriptionConfig(language="pt"), model=mock_model)
+        adapter.transcribe(np.zeros(16000, dtype=np.int16))
+        assert mock_model.transcribe.call_args[1]["language"] == "pt"
+
+
 class TestWhisperCLITranscription:
     @patch("hey_clever.adapters.whisper_transcription.os.unlink")
     @patch("hey_clever.adapters.whisper_transcription.os.path.exists", return_value=False)
@@ -104,22 +133,19 @@ class TestWhisperCLITranscription:
         idx = call_args.index("--model")
         assert call_args[idx + 1] == "medium"
 
-    def test_save_wav_creates_file(self, tmp_path):
-        audio = np.array([100, -100, 200, -200], dtype=np.int16)
-
+    def test_save_wav_creates_file(self):
         import os
         import wave
 
-        # Use the static method directly
-        fd, path = __import__("tempfile").mkstemp(suffix=".wav", dir=str(tmp_path))
-        os.close(fd)
-        with wave.open(path, "wb") as wf:
-            wf.setnchannels(1)
-            wf.setsampwidth(2)
-            wf.setframerate(16000)
-            wf.writeframes(audio.tobytes())
-
-        assert os.path.exists(path)
-        with wave.open(path, "rb") as wf:
-            assert wf.getnchannels() == 1
-            assert wf.getframerate() == 16000
+        audio = np.array([100, -100, 200, -200], dtype=np.int16)
+        path = WhisperCLITranscription._save_wav(audio)
+        try:
+            assert os.path.exists(path)
+            with wave.open(path, "rb") as wf:
+                assert wf.getnchannels() == 1
+                assert wf.getframerate() == 16000
+                assert wf.getsampwidth() == 2
+                frames = wf.readframes(wf.getnframes())
+            np.testing.assert_array_equal(np.frombuffer(frames, dtype=np.int16), audio)
+        finally:
+            os.unlink(path)
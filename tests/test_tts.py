@@ -1,8 +1,13 @@
 """Tests for EdgeTTS adapter."""
 
+import sys
+import types
 from unittest.mock import MagicMock, patch
 
-from hey_clever.adapters.edge_tts_adapter import EdgeTTSAdapter
+import pytest
+
+from hey_clever.adapters import edge_tts_adapter
+from hey_clever.adapters.edge_tts_adapter import EdgeTTSAdapter, _MpvController
 from hey_clever.config.settings import TTSConfig
 
 
@@ -10,6 +15,39 @@ def _make_tts() -> EdgeTTSAdapter:
     return EdgeTTSAdapter(TTSConfig(mpv_bin="/usr/bin/mpv"))
 
 
+@pytest.fixture(autouse=True)
+def hermetic_subprocesses():
+    """No TTS test may spawn real processes.
+
+    Unpatched, speak() would run wpctl (unmuting the host's audio sink and
+    forcing its volume to 100%), launch a live mpv, and — with edge_tts
+    installed — drive a real network synthesis request.
+    """
+    with (
+        patch.object(edge_tts_adapter.subprocess, "Popen") as popen,
+        patch.object(edge_tts_adapter.subprocess, "run") as run,
+    ):
+        run.return_value = MagicMock(returncode=0)
+        yield types.SimpleNamespace(popen=popen, run=run)
+
+
+def _fake_edge_tts(chunks: list[dict]) -> types.ModuleType:
+    """A stand-in edge_tts module whose Communicate streams the given chunks."""
+
+    class Communicate:
+        def __init__(self, text: str, voice: str) -> None:
+            self.text = text
+            self.voice = voice
+
+        async def stream(self):
+            for chunk in chunks:
+                yield chunk
+
+    module = types.ModuleType("edge_tts")
+    module.Communicate = Communicate  # type: ignore[attr-defined]
+    return module
+
+
 class TestEdgeTTSAdapter:
     def test_not_speaking_initially(self):
         tts = _make_tts()
@@ -20,22 +58,142 @@ class TestEdgeTTSAdapter:
         tts.stop()
         assert tts.is_speaking() is False
 
-    @patch("hey_clever.adapters.edge_tts_adapter.subprocess.run")
     @patch("hey_clever.adapters.edge_tts_adapter.os.path.exists", return_value=True)
     @patch("hey_clever.adapters.edge_tts_adapter.os.path.getsize", return_value=1000)
     @patch("hey_clever.adapters.edge_tts_adapter.os.unlink")
-    def test_speak_success(self, mock_unlink, mock_size, mock_exists, mock_run):
-        mock_run.return_value = MagicMock(returncode=0)
+    def test_speak_success(self, mock_unlink, mock_size, mock_exists):
         tts = _make_tts()
-        result = tts.speak("hello")
+        with (
+            patch.object(tts, "_speak_streaming", return_value=False),
+            patch.object(tts._mpv, "play", return_value=True) as mock_play,
+        ):
+            result = tts.speak("hello")
         assert result is False
         assert tts.is_speaking() is False
+        mock_play.assert_called_once()
 
-    @patch("hey_clever.adapters.edge_tts_adapter.subprocess.run")
     @patch("hey_clever.adapters.edge_tts_adapter.os.path.exists", return_value=True)
     @patch("hey_clever.adapters.edge_tts_adapter.os.unlink")
-    def test_speak_edge_tts_failure_tries_fallback(self, mock_unlink, mock_exists, mock_run):
-        mock_run.side_effect = Exception("edge-tts broken")
+    def test_speak_edge_tts_failure_tries_fallback(
+        self, mock_unlink, mock_exists, hermetic_subprocesses
+    ):
+        hermetic_subprocesses.run.side_effect = Exception("edge-tts broken")
+        tts = _make_tts()
+        with patch.object(tts, "_speak_streaming", return_value=False):
+            result = tts.speak("hello")
+        assert result is False
+
+
+class TestSinkPreparation:
+    def test_wpctl_only_runs_through_the_patched_popen(self, hermetic_subprocesses):
+        tts = _make_tts()
+        tts._prepare_sink({"XDG_RUNTIME_DIR": "/run/user/1000"})
+        argvs = [c.args[0] for c in hermetic_subprocesses.popen.call_args_list]
+        assert argvs == [
+            ["wpctl", "set-mute", "@DEFAULT_AUDIO_SINK@", "0"],
+            ["wpctl", "set-volume", "@DEFAULT_AUDIO_SINK@", "1.0"],
+        ]
+
+    def test_preparation_is_cached_within_reprobe_window(self, hermetic_subprocesses):
+        tts = _make_tts()
+        tts._prepare_sink({"XDG_RUNTIME_DIR": "/run/user/1000"})
+        tts._await_sink()
+        tts._prepare_sink({"XDG_RUNTIME_DIR": "/run/user/1000"})
+        assert hermetic_subprocesses.popen.call_count == 2
+
+    def test_missing_wpctl_is_tolerated(self, hermetic_subprocesses):
+        hermetic_subprocesses.popen.side_effect = OSError("wpctl not found")
+        tts = _make_tts()
+        tts._prepare_sink({"XDG_RUNTIME_DIR": "/run/user/1000"})  # must not raise
+        tts._await_sink()
+
+
+class TestSpeakStreaming:
+    def test_streams_chunks_into_mpv_stdin(self, monkeypatch, hermetic_subprocesses):
+        monkeypatch.setitem(
+            sys.modules,
+            "edge_tts",
+            _fake_edge_tts(
+                [
+                    {"type": "audio", "data": b"mp3-one"},
+                    {"type": "WordBoundary", "offset": 0},
+                    {"type": "audio", "data": b"mp3-two"},
+                ]
+            ),
+        )
+        proc = MagicMock()
+        hermetic_subprocesses.popen.return_value = proc
+
         tts = _make_tts()
         result = tts.speak("hello")
+
         assert result is False
+        assert tts.is_speaking() is False
+        # Only audio chunks reach mpv, in order
+        written = [c.args[0] for c in proc.stdin.write.call_args_list]
+        assert written == [b"mp3-one", b"mp3-two"]
+        proc.stdin.close.assert_called_once()
+        # mpv was launched reading from stdin
+        mpv_calls = [
+            c.args[0]
+            for c in hermetic_subprocesses.popen.call_args_list
+            if c.args[0][0] == "/usr/bin/mpv"
+        ]
+        assert mpv_calls == [["/usr/bin/mpv", "--no-video", "--ao=pipewire", "-"]]
+
+    def test_missing_edge_tts_returns_false(self, monkeypatch, hermetic_subprocesses):
+        # A None sys.modules entry makes `import edge_tts` raise ImportError
+        monkeypatch.setitem(sys.modules, "edge_tts", None)
+        tts = _make_tts()
+        assert tts._speak_streaming("hello") is False
+        hermetic_subprocesses.popen.assert_not_called()
+
+    def test_stream_error_kills_mpv_and_returns_false(self, monkeypatch, hermetic_subprocesses):
+        class _Exploding:
+            def __init__(self, text: str, voice: str) -> None:
+                pass
+
+            async def stream(self):
+                raise RuntimeError("synthesis failed")
+                yield  # pragma: no cover
+
+        module = types.ModuleType("edge_tts")
+        module.Communicate = _Exploding  # type: ignore[attr-defined]
+        monkeypatch.setitem(sys.modules, "edge_tts", module)
+        proc = MagicMock()
+        hermetic_subprocesses.popen.return_value = proc
+
+        tts = _make_tts()
+        assert tts._speak_streaming("hello") is False
+        proc.kill.assert_called_once()
+        assert tts.is_speaking() is False
+
+
+class TestMpvController:
+    def test_play_returns_false_when_mpv_missing(self, hermetic_subprocesses):
+        hermetic_subprocesses.popen.side_effect = OSError("no mpv")
+        ctrl = _MpvController("/usr/bin/mpv")
+        assert ctrl.play("/tmp/x.mp3") is False
+
+    def test_play_sends_loadfile_and_waits_for_end(self):
+        ctrl = _MpvController("/usr/bin/mpv")
+        ctrl._proc = MagicMock(poll=MagicMock(return_value=None))
+        sock = MagicMock()
+        sock.recv.return_value = b'{"event":"end-file"}\n'
+        ctrl._sock = sock
+
+        assert ctrl.play("/tmp/x.mp3") is True
+        sent = sock.sendall.call_args[0][0]
+        assert b"loadfile" in sent
+        assert b"/tmp/x.mp3" in sent
+
+    def test_interrupt_sends_stop(self):
+        ctrl = _MpvController("/usr/bin/mpv")
+        sock = MagicMock()
+        ctrl._sock = sock
+        ctrl.interrupt()
+        assert b"stop" in sock.sendall.call_args[0][0]
+
+    def test_interrupt_without_socket_is_noop(self):
+        ctrl = _MpvController("/usr/bin/mpv")
+        ctrl.interrupt()  # must not raise
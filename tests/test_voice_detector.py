@@ -5,12 +5,16 @@ from __future__ import annotations
 from unittest.mock import MagicMock
 
 import numpy as np
-import pytest
 
 from hey_clever.config.settings import Settings
 from hey_clever.domain.detector_state import DetectorState
 from hey_clever.domain.vad import SileroVAD
-from hey_clever.domain.voice_detector import VoiceDetector, _rms
+from hey_clever.domain.voice_detector import VoiceDetector
+
+# Shared read-only silent block — tests only read chunks, so one allocation
+# serves the whole module.
+_SILENT_CHUNK = np.zeros(512, dtype=np.int16)
+_SILENT_CHUNK.setflags(write=False)
 
 
 def _make_detector(
@@ -21,7 +25,7 @@ def _make_detector(
     gateway_response: str = "ok",
 ) -> tuple[VoiceDetector, dict[str, MagicMock]]:
     audio_input = MagicMock()
-    audio_input.read_chunk.return_value = np.zeros(512, dtype=np.int16)
+    audio_input.read_chunk.return_value = _SILENT_CHUNK
     audio_input.get_sample_rate.return_value = 16000
 
     vad = MagicMock(spec=SileroVAD)
@@ -72,13 +76,18 @@ def _make_detector(
     return detector, mocks
 
 
-class TestRms:
-    def test_silence(self):
-        assert _rms(np.zeros(512, dtype=np.int16)) == 0.0
+class TestSilenceDetection:
+    def test_loud_block_marks_speech(self):
+        detector, _ = _make_detector()
+        detector._enter_activated()
+        detector._handle_activated(np.full(512, 1000, dtype=np.int16))
+        assert detector._cmd_got_speech is True
 
-    def test_nonzero(self):
-        block = np.ones(512, dtype=np.int16) * 1000
-        assert _rms(block) == pytest.approx(1000.0, rel=1e-3)
+    def test_silent_block_does_not_mark_speech(self):
+        detector, _ = _make_detector()
+        detector._enter_activated()
+        detector._handle_activated(_SILENT_CHUNK)
+        assert detector._cmd_got_speech is False
 
 
 class TestVoiceDetectorInit:
@@ -96,14 +105,14 @@ class TestVoiceDetectorInit:
 class TestHandleIdle:
     def test_no_speech_stays_idle(self):
         detector, mocks = _make_detector()
-        chunk = np.zeros(512, dtype=np.int16)
+        chunk = _SILENT_CHUNK
         mocks["vad"].is_speech.return_value = False
         detector._handle_idle(chunk)
         assert detector.state == DetectorState.IDLE
 
     def test_speech_transitions_to_listening(self):
         detector, mocks = _make_detector()
-        chunk = np.zeros(512, dtype=np.int16)
+        chunk = _SILENT_CHUNK
         mocks["vad"].is_speech.return_value = True
         detector._handle_idle(chunk)
         assert detector.state == DetectorState.LISTENING
@@ -112,19 +121,41 @@ class TestHandleIdle:
 class TestCheckKeyword:
     def test_keyword_detected_enters_activated(self):
         detector, mocks = _make_detector(kw_text="hey clever", kw_detected=True)
-        detector._kw_buffer.add(np.zeros(512, dtype=np.int16))
+        detector._kw_buffer.add(_SILENT_CHUNK)
         detector._check_keyword()
         assert detector.state == DetectorState.ACTIVATED
         mocks["sound_cues"].on_keyword_detected.assert_called_once()
 
     def test_no_keyword_resets_to_idle(self):
         detector, mocks = _make_detector(kw_text="hello world", kw_detected=False)
-        detector._kw_buffer.add(np.zeros(512, dtype=np.int16))
+        detector._kw_buffer.add(_SILENT_CHUNK)
         detector.state = DetectorState.LISTENING
         detector._check_keyword()
         assert detector.state == DetectorState.IDLE
 
 
+class TestPartialKeywordCheck:
+    def test_keyword_mid_utterance_activates_early(self):
+        detector, mocks = _make_detector(kw_text="hey clever", kw_detected=True)
+        chunk = _SILENT_CHUNK
+        detector._handle_idle(chunk, is_speech=True)
+        # ~1s of continuous speech triggers a partial check before any silence
+        for _ in range(40):
+            detector._handle_listening(chunk, is_speech=True)
+            if detector.state == DetectorState.ACTIVATED:
+                break
+        assert detector.state == DetectorState.ACTIVATED
+        mocks["sound_cues"].on_keyword_detected.assert_called_once()
+
+    def test_partial_miss_keeps_listening(self):
+        detector, mocks = _make_detector(kw_text="hello world", kw_detected=False)
+        chunk = _SILENT_CHUNK
+        detector._handle_idle(chunk, is_speech=True)
+        for _ in range(40):
+            detector._handle_listening(chunk, is_speech=True)
+        assert detector.state == DetectorState.LISTENING
+
+
 class TestProcessCommand:
     def test_full_pipeline(self):
         detector, mocks = _make_detector(
@@ -133,7 +164,7 @@ class TestProcessCommand:
         )
         detector.state = DetectorState.ACTIVATED
         detector._cmd_got_speech = True
-        detector._cmd_buffer.add(np.ones(16000, dtype=np.int16) * 1000)
+        detector._cmd_buffer.add(np.full(16000, 1000, dtype=np.int16))
 
         detector._process_command()
 
@@ -150,7 +181,7 @@ class TestProcessCommand:
         detector, mocks = _make_detector(cmd_text="")
         detector.state = DetectorState.ACTIVATED
         detector._cmd_got_speech = True
-        detector._cmd_buffer.add(np.ones(16000, dtype=np.int16) * 1000)
+        detector._cmd_buffer.add(np.full(16000, 1000, dtype=np.int16))
 
         detector._process_command()
 
@@ -162,7 +193,7 @@ class TestProcessCommand:
         detector.state = DetectorState.ACTIVATED
         detector._cmd_got_speech = True
         # add very short audio (less than min_duration)
-        detector._cmd_buffer.add(np.ones(100, dtype=np.int16) * 1000)
+        detector._cmd_buffer.add(np.full(100, 1000, dtype=np.int16))
 
         detector._process_command()
 